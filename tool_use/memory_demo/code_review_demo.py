@@ -11,10 +11,12 @@ Requires:
 - memory_tool.py in the same directory
 """
 
+import importlib.util
 import os
 from typing import Any, Dict, List, Optional
 
-from anthropic import Anthropic
+import httpx
+from anthropic import Anthropic, DefaultHttpxClient
 from dotenv import load_dotenv
 
 import sys
@@ -55,6 +57,24 @@ CONTEXT_MANAGEMENT = {
     ]
 }
 
+# Tool and beta configuration shared by every API call
+TOOLS = [{"type": "memory_20250818", "name": "memory"}]
+BETAS = ["context-management-2025-06-27"]
+
+# Maximum API calls per review, to prevent runaway tool-use loops
+MAX_TURNS = 8
+
+# Connection pool tuned for repeated calls to the same API host
+HTTP_LIMITS = httpx.Limits(
+    max_connections=10, max_keepalive_connections=10, keepalive_expiry=90
+)
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Sample files to review, resolved relative to this script (not the CWD)
+SAMPLE_DIR = Path(__file__).parent / "sample_code"
+
 
 class CodeReviewAssistant:
     """
@@ -66,20 +86,8 @@ class CodeReviewAssistant:
     - Automatically clears old tool results when context grows large
     """
 
-    def __init__(self, memory_storage_path: str = "./memory_storage"):
-        """
-        Initialize the code review assistant.
-
-        Args:
-            memory_storage_path: Path for memory storage
-        """
-        self.client = Anthropic(api_key=API_KEY)
-        self.memory_handler = MemoryToolHandler(base_path=memory_storage_path)
-        self.messages: List[Dict[str, Any]] = []
-
-    def _create_system_prompt(self) -> str:
-        """Create system prompt with memory instructions."""
-        return """You are an expert code reviewer focused on finding bugs and suggesting improvements.
+    # System prompt with memory instructions
+    SYSTEM_PROMPT = """You are an expert code reviewer focused on finding bugs and suggesting improvements.
 
 MEMORY PROTOCOL:
 1. Check your /memories directory for relevant debugging patterns or insights
@@ -94,6 +102,31 @@ When reviewing code:
 
 Remember: Your memory persists across conversations. Use it wisely."""
 
+    def __init__(self, memory_storage_path: str = "./memory_storage"):
+        """
+        Initialize the code review assistant.
+
+        Args:
+            memory_storage_path: Path for memory storage
+        """
+        # Keep-alive (+ HTTP/2 when available) so every turn reuses one connection
+        transport = httpx.HTTPTransport(http2=HTTP2, retries=2, limits=HTTP_LIMITS)
+        self.client = Anthropic(
+            api_key=API_KEY, http_client=DefaultHttpxClient(transport=transport)
+        )
+        self.memory_handler = MemoryToolHandler(base_path=memory_storage_path)
+        self.messages: List[Dict[str, Any]] = []
+
+    def __enter__(self) -> "CodeReviewAssistant":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self.client.close()
+
     def _execute_tool_use(self, tool_use: Any) -> str:
         """Execute a tool use and return the result."""
         if tool_use.name == "memory":
@@ -115,11 +148,12 @@ Remember: Your memory persists across conversations. Use it wisely."""
         Returns:
             Dict with review results and metadata
         """
-        # Construct user message
-        user_message = f"Please review this code from {filename}"
+        # Construct user message in a single join (code can be large)
+        parts = ["Please review this code from ", filename]
         if description:
-            user_message += f"\n\nContext: {description}"
-        user_message += f"\n\n```python\n{code}\n```"
+            parts += ["\n\nContext: ", description]
+        parts += ["\n\n```python\n", code, "\n```"]
+        user_message = "".join(parts)
 
         self.messages.append({"role": "user", "content": user_message})
 
@@ -129,15 +163,15 @@ Remember: Your memory persists across conversations. Use it wisely."""
 
         # Conversation loop
         turn = 1
-        while True:
+        while turn <= MAX_TURNS:
             print(f"  🔄 Turn {turn}: Calling Claude API...", end="", flush=True)
             response = self.client.beta.messages.create(
                 model=MODEL,
                 max_tokens=4096,
-                system=self._create_system_prompt(),
+                system=self.SYSTEM_PROMPT,
                 messages=self.messages,
-                tools=[{"type": "memory_20250818", "name": "memory"}],
-                betas=["context-management-2025-06-27"],
+                tools=TOOLS,
+                betas=BETAS,
                 context_management=CONTEXT_MANAGEMENT,
             )
 
@@ -197,6 +231,8 @@ Remember: Your memory persists across conversations. Use it wisely."""
                 # No more tool uses, we're done
                 print()
                 break
+        else:
+            print(f"  ⚠️  Stopped after {MAX_TURNS} turns\n")
 
         return {
             "review": "\n".join(final_text),
@@ -215,21 +251,19 @@ def run_session_1() -> None:
     print("SESSION 1: Learning from First Code Review")
     print("=" * 80)
 
-    assistant = CodeReviewAssistant()
-
     # Read sample code
-    with open("memory_demo/sample_code/web_scraper_v1.py", "r") as f:
-        code = f.read()
+    code = (SAMPLE_DIR / "web_scraper_v1.py").read_text()
 
     print("\n📋 Reviewing web_scraper_v1.py...")
     print("\nMulti-threaded web scraper that sometimes loses results.\n")
 
-    result = assistant.review_code(
-        code=code,
-        filename="web_scraper_v1.py",
-        description="This scraper sometimes returns fewer results than expected. "
-        "The count is inconsistent across runs. Can you find the issue?",
-    )
+    with CodeReviewAssistant() as assistant:
+        result = assistant.review_code(
+            code=code,
+            filename="web_scraper_v1.py",
+            description="This scraper sometimes returns fewer results than expected. "
+            "The count is inconsistent across runs. Can you find the issue?",
+        )
 
     print("\n🤖 Claude's Review:\n")
     print(result["review"])
@@ -247,22 +281,20 @@ def run_session_2() -> None:
     print("SESSION 2: Applying Learned Patterns (New Conversation)")
     print("=" * 80)
 
-    # New assistant instance (new conversation, but memory persists)
-    assistant = CodeReviewAssistant()
-
     # Read different sample code with similar bug
-    with open("memory_demo/sample_code/api_client_v1.py", "r") as f:
-        code = f.read()
+    code = (SAMPLE_DIR / "api_client_v1.py").read_text()
 
     print("\n📋 Reviewing api_client_v1.py...")
     print("\nAsync API client with concurrent requests.\n")
 
-    result = assistant.review_code(
-        code=code,
-        filename="api_client_v1.py",
-        description="Review this async API client. "
-        "It fetches multiple endpoints concurrently. Are there any issues?",
-    )
+    # New assistant instance (new conversation, but memory persists)
+    with CodeReviewAssistant() as assistant:
+        result = assistant.review_code(
+            code=code,
+            filename="api_client_v1.py",
+            description="Review this async API client. "
+            "It fetches multiple endpoints concurrently. Are there any issues?",
+        )
 
     print("\n🤖 Claude's Review:\n")
     print(result["review"])
@@ -277,21 +309,19 @@ def run_session_3() -> None:
     print("SESSION 3: Long Session with Context Editing")
     print("=" * 80)
 
-    assistant = CodeReviewAssistant()
-
     # Read data processor code (has multiple issues)
-    with open("memory_demo/sample_code/data_processor_v1.py", "r") as f:
-        code = f.read()
+    code = (SAMPLE_DIR / "data_processor_v1.py").read_text()
 
     print("\n📋 Reviewing data_processor_v1.py...")
     print("\nLarge file with multiple concurrent processing classes.\n")
 
-    result = assistant.review_code(
-        code=code,
-        filename="data_processor_v1.py",
-        description="This data processor handles files concurrently. "
-        "There's also a SharedCache class. Review all components for issues.",
-    )
+    with CodeReviewAssistant() as assistant:
+        result = assistant.review_code(
+            code=code,
+            filename="data_processor_v1.py",
+            description="This data processor handles files concurrently. "
+            "There's also a SharedCache class. Review all components for issues.",
+        )
 
     print("\n🤖 Claude's Review:\n")
     print(result["review"])
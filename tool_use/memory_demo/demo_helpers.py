@@ -10,6 +10,10 @@ from typing import Any
 from anthropic import Anthropic
 from memory_tool import MemoryToolHandler
 
+# Tool and beta configuration shared by every API call
+TOOLS: list[dict[str, Any]] = [{"type": "memory_20250818", "name": "memory"}]
+BETAS: list[str] = ["context-management-2025-06-27"]
+
 
 def execute_tool(tool_use: Any, memory_handler: MemoryToolHandler) -> str:
     """
@@ -54,15 +58,13 @@ def run_conversation_turn(
     Returns:
         Tuple of (response, assistant_content, tool_results)
     """
-    memory_tool: dict[str, Any] = {"type": "memory_20250818", "name": "memory"}
-
     request_params: dict[str, Any] = {
         "model": model,
         "max_tokens": max_tokens,
         "system": system,
         "messages": messages,
-        "tools": [memory_tool],
-        "betas": ["context-management-2025-06-27"]
+        "tools": TOOLS,
+        "betas": BETAS
     }
 
     if context_management:
@@ -16,11 +16,56 @@ class AsyncAPIClient:
         self.base_url = base_url
         self.responses = []  # BUG: Shared state accessed from multiple coroutines!
         self.error_count = 0  # BUG: Race condition on counter increment!
+        self._session: Optional[aiohttp.ClientSession] = None
+        # One in-flight/completed request per endpoint (successful responses
+        # and HTTP error statuses; failed or cancelled requests are retried)
+        self._cache: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                keepalive_timeout=60,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def fetch_endpoint(
         self, session: aiohttp.ClientSession, endpoint: str
     ) -> Dict[str, Any]:
-        """Fetch a single endpoint."""
+        """Fetch a single endpoint, sharing one request between duplicates."""
+        future = self._cache.get(endpoint)
+        if future is None:
+            future = asyncio.ensure_future(self._request_endpoint(session, endpoint))
+            self._cache[endpoint] = future
+            future.add_done_callback(
+                lambda done: self._evict_if_failed(endpoint, done)
+            )
+        # Shield so a cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(future)
+
+    def _evict_if_failed(
+        self, endpoint: str, future: "asyncio.Future[Dict[str, Any]]"
+    ) -> None:
+        """Drop cancelled requests and transport errors so they are retried."""
+        if future.cancelled() or "error" in future.result():
+            if self._cache.get(endpoint) is future:
+                del self._cache[endpoint]
+
+    async def _request_endpoint(
+        self, session: aiohttp.ClientSession, endpoint: str
+    ) -> Dict[str, Any]:
+        """Request a single endpoint over the network."""
         url = f"{self.base_url}/{endpoint}"
         try:
             async with session.get(
@@ -38,26 +83,34 @@ class AsyncAPIClient:
                 "error": str(e),
             }
 
-    async def fetch_all(self, endpoints: List[str]) -> List[Dict[str, Any]]:
+    async def fetch_all(
+        self, endpoints: List[str], max_concurrency: int = 20
+    ) -> List[Dict[str, Any]]:
         """
         Fetch multiple endpoints concurrently.
 
+        At most max_concurrency requests are in flight at once, reusing the
+        client's pooled session across calls.
+
         BUG: Similar to the threading issue, multiple coroutines
         modify self.responses and self.error_count without coordination!
         While Python's GIL prevents some race conditions in threads,
         async code can still have interleaving issues.
         """
-        async with aiohttp.ClientSession() as session:
-            tasks = [self.fetch_endpoint(session, endpoint) for endpoint in endpoints]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        session = await self._get_session()
+
+        async def fetch_bounded(endpoint: str) -> None:
+            async with semaphore:
+                result = await self.fetch_endpoint(session, endpoint)
 
-            for coro in asyncio.as_completed(tasks):
-                result = await coro
+            # RACE CONDITION: Multiple coroutines modify shared state
+            if "error" in result:
+                self.error_count += 1  # Not atomic!
+            else:
+                self.responses.append(result)  # Not thread-safe in async context!
 
-                # RACE CONDITION: Multiple coroutines modify shared state
-                if "error" in result:
-                    self.error_count += 1  # Not atomic!
-                else:
-                    self.responses.append(result)  # Not thread-safe in async context!
+        await asyncio.gather(*(fetch_bounded(endpoint) for endpoint in endpoints))
 
         return self.responses
 
@@ -87,7 +140,10 @@ async def main():
         "invalid/endpoint",  # Will error
     ] * 20  # 120 requests total
 
-    results = await client.fetch_all(endpoints)
+    try:
+        results = await client.fetch_all(endpoints)
+    finally:
+        await client.aclose()
 
     print(f"Expected: ~100 successful responses")
     print(f"Got: {len(results)} responses")
@@ -3,13 +3,15 @@ Cache manager with mutable default argument bug.
 This is one of Python's most common gotchas.
 """
 
-from datetime import datetime
+from time import time_ns
 from typing import Dict, List, Optional, Any
 
 
 class CacheManager:
     """Manage cached data with TTL support."""
 
+    DEFAULT_CONFIG: Dict[str, Any] = {"timeout": 30, "retries": 3, "cache_enabled": True}
+
     def __init__(self):
         self.cache = {}
 
@@ -23,16 +25,15 @@ class CacheManager:
         This is one of Python's classic gotchas.
         """
         # The items list is shared across ALL calls that don't provide items
-        items.append(f"Added at {datetime.now()}")
+        items.append(f"Added at {time_ns()}")
         self.cache[key] = items
 
     def add_items_fixed(self, key: str, items: Optional[List[str]] = None) -> None:
         """Add items with proper default handling."""
         if items is None:
-            items = []
-        items = items.copy()  # Also make a copy to avoid mutation
-        items.append(f"Added at {datetime.now()}")
-        self.cache[key] = items
+            items = ()
+        # Build a new list (never mutate the caller's) in one allocation
+        self.cache[key] = [*items, f"Added at {time_ns()}"]
 
     def merge_configs(
         self, name: str, overrides: Dict[str, Any] = {}  # BUG: Mutable default!
@@ -42,10 +43,8 @@ class CacheManager:
 
         BUG: The default dict is shared across all calls!
         """
-        defaults = {"timeout": 30, "retries": 3, "cache_enabled": True}
-
         # This modifies the SHARED overrides dict
-        overrides.update(defaults)
+        overrides |= self.DEFAULT_CONFIG
         return overrides
 
     def merge_configs_fixed(
@@ -55,11 +54,8 @@ class CacheManager:
         if overrides is None:
             overrides = {}
 
-        defaults = {"timeout": 30, "retries": 3, "cache_enabled": True}
-
-        # Create new dict to avoid mutation
-        result = {**defaults, **overrides}
-        return result
+        # Create new dict to avoid mutation (single C-level merge)
+        return self.DEFAULT_CONFIG | overrides
 
 
 class DataProcessor:
@@ -75,12 +71,10 @@ class DataProcessor:
         """
         filters.append("default_filter")  # Modifies shared list!
 
-        result = []
-        for item in data:
-            if "positive" in filters and item < 0:
-                continue
-            result.append(item * 2)
-        return result
+        # Inspect filters once per batch, not once per item
+        drop_negative = "positive" in filters
+
+        return [item * 2 for item in data if not (drop_negative and item < 0)]
 
 
 if __name__ == "__main__":
@@ -3,63 +3,86 @@ Data processor with multiple concurrency and thread-safety issues.
 Used for Session 3 to demonstrate context editing with multiple bugs.
 """
 
+import itertools
 import json
+import os
 import threading
-from concurrent.futures import ThreadPoolExecutor
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import List, Dict, Any
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # Fall back to the stdlib parser if orjson isn't installed
+    _json_loads = json.loads
+
+
+@dataclass(slots=True)
+class FileResult:
+    """Outcome of processing a single file."""
+
+    file: str
+    ok: bool
+    record_count: int = 0
+    size_bytes: int = 0
+    error: str = ""
+
 
 class DataProcessor:
     """Process data files concurrently with various thread-safety issues."""
 
-    def __init__(self, max_workers: int = 5):
+    def __init__(self, max_workers: int = 5, use_processes: bool = False):
         self.max_workers = max_workers
+        # Processes sidestep the GIL for CPU-bound (JSON-heavy) batches
+        self.use_processes = use_processes
         self.processed_count = 0  # BUG: Race condition on counter
+        self._counter = itertools.count(1)
         self.results = []  # BUG: Shared list without locking
         self.errors = {}  # BUG: Shared dict without locking
         self.lock = threading.Lock()  # Available but not used!
 
-    def process_file(self, file_path: str) -> Dict[str, Any]:
-        """Process a single file."""
+    @staticmethod
+    def process_file(file_path: str) -> FileResult:
+        """Process a single file (static so it pickles for process pools)."""
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            with open(file_path, "rb") as f:
+                size_bytes = os.fstat(f.fileno()).st_size
+                data = _json_loads(f.read())
 
             # Simulate some processing
-            processed = {
-                "file": file_path,
-                "record_count": len(data) if isinstance(data, list) else 1,
-                "size_bytes": Path(file_path).stat().st_size,
-            }
-
-            return processed
+            return FileResult(
+                file=file_path,
+                ok=True,
+                record_count=len(data) if isinstance(data, list) else 1,
+                size_bytes=size_bytes,
+            )
 
         except Exception as e:
-            return {"file": file_path, "error": str(e)}
+            return FileResult(file=file_path, ok=False, error=str(e))
 
-    def process_batch(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+    def process_batch(self, file_paths: List[str]) -> List[FileResult]:
         """
         Process multiple files concurrently.
 
         MULTIPLE BUGS:
-        1. self.processed_count is incremented without locking
+        1. self.processed_count is updated without locking
         2. self.results is appended to from multiple threads
         3. self.errors is modified from multiple threads
         4. We have a lock but don't use it!
         """
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = [executor.submit(self.process_file, fp) for fp in file_paths]
-
-            for future in futures:
-                result = future.result()
-
-                # RACE CONDITION: Increment counter without lock
-                self.processed_count += 1  # BUG!
-
-                if "error" in result:
+        executor_cls = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        # Batch work items per dispatch (only process pools use chunksize)
+        chunksize = max(1, len(file_paths) // (self.max_workers * 4))
+        with executor_cls(max_workers=self.max_workers) as executor:
+            for result in executor.map(self.process_file, file_paths, chunksize=chunksize):
+                # RACE CONDITION: Update counter without lock
+                self.processed_count = next(self._counter)  # BUG!
+
+                if not result.ok:
                     # RACE CONDITION: Modify dict without lock
-                    self.errors[result["file"]] = result["error"]  # BUG!
+                    self.errors[result.file] = result.error  # BUG!
                 else:
                     # RACE CONDITION: Append to list without lock
                     self.results.append(result)  # BUG!
@@ -92,6 +115,7 @@ class DataProcessor:
         BUG: No locking - if called during processing, causes corruption.
         """
         self.processed_count = 0  # RACE CONDITION
+        self._counter = itertools.count(1)  # RACE CONDITION
         self.results = []  # RACE CONDITION
         self.errors = {}  # RACE CONDITION
 
@@ -3,11 +3,15 @@ Concurrent web scraper with a race condition bug.
 Multiple threads modify shared state without synchronization.
 """
 
+import importlib.util
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 
-import requests
+import httpx
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1
+HTTP2 = importlib.util.find_spec("h2") is not None
 
 
 class WebScraper:
@@ -17,18 +21,40 @@ class WebScraper:
         self.max_workers = max_workers
         self.results = []  # BUG: Shared mutable state accessed by multiple threads!
         self.failed_urls = []  # BUG: Another race condition!
+        # Running totals so get_stats doesn't recount the lists
+        self._success = 0
+        self._fail = 0
+
+        # One client shared by all worker threads, so requests to the same
+        # host reuse kept-alive connections (multiplexed when HTTP/2 is on)
+        self.client = httpx.Client(
+            http2=HTTP2,
+            timeout=5,
+            follow_redirects=True,  # like requests.get
+            limits=httpx.Limits(max_connections=max_workers),
+        )
+
+    def __enter__(self) -> "WebScraper":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the shared HTTP client."""
+        self.client.close()
 
     def fetch_url(self, url: str) -> Dict[str, Any]:
         """Fetch a single URL and return the result."""
         try:
-            response = requests.get(url, timeout=5)
+            response = self.client.get(url)
             response.raise_for_status()
             return {
                 "url": url,
                 "status": response.status_code,
                 "content_length": len(response.content),
             }
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
             return {"url": url, "error": str(e)}
 
     def scrape_urls(self, urls: List[str]) -> List[Dict[str, Any]]:
@@ -39,29 +65,24 @@ class WebScraper:
         This causes race conditions where results can be lost or corrupted.
         """
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = [executor.submit(self.fetch_url, url) for url in urls]
-
-            for future in as_completed(futures):
-                result = future.result()
-
+            for result in executor.map(self.fetch_url, urls):
                 # RACE CONDITION: Multiple threads append to self.results simultaneously
                 if "error" in result:
                     self.failed_urls.append(result["url"])  # RACE CONDITION
+                    self._fail += 1
                 else:
                     self.results.append(result)  # RACE CONDITION
+                    self._success += 1
 
         return self.results
 
     def get_stats(self) -> Dict[str, int]:
         """Get scraping statistics."""
+        total = self._success + self._fail
         return {
-            "total_results": len(self.results),
-            "failed_urls": len(self.failed_urls),
-            "success_rate": (
-                len(self.results) / (len(self.results) + len(self.failed_urls))
-                if (len(self.results) + len(self.failed_urls)) > 0
-                else 0
-            ),
+            "total_results": self._success,
+            "failed_urls": self._fail,
+            "success_rate": self._success / total if total > 0 else 0,
         }
 
 
@@ -75,8 +96,8 @@ if __name__ == "__main__":
         "https://httpbin.org/status/500",
     ] * 10  # 50 URLs total to increase race condition probability
 
-    scraper = WebScraper(max_workers=10)
-    results = scraper.scrape_urls(urls)
+    with WebScraper(max_workers=10) as scraper:
+        results = scraper.scrape_urls(urls)
 
     print(f"Expected: 50 results")
     print(f"Got: {len(results)} results")
@@ -5,6 +5,7 @@ This implementation provides secure, client-side execution of memory operations
 with path validation, error handling, and comprehensive security measures.
 """
 
+import os
 import shutil
 from pathlib import Path
 from typing import Any
@@ -129,11 +130,14 @@ class MemoryToolHandler:
         # Handle directory listing
         if full_path.is_dir():
             try:
-                items = []
-                for item in sorted(full_path.iterdir()):
-                    if item.name.startswith("."):
-                        continue
-                    items.append(f"{item.name}/" if item.is_dir() else item.name)
+                # scandir exposes each entry's type without an extra stat call
+                with os.scandir(full_path) as entries:
+                    listing = sorted(
+                        (entry.name, entry.is_dir())
+                        for entry in entries
+                        if not entry.name.startswith(".")
+                    )
+                items = [f"{name}/" if is_dir else name for name, is_dir in listing]
 
                 if not items:
                     return {"success": f"Directory: {path}\n(empty)"}
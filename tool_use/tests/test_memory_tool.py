@@ -4,423 +4,445 @@ Unit tests for the memory tool handler.
 Tests security validation, command execution, and error handling.
 """
 
-import shutil
-import tempfile
-import unittest
-from pathlib import Path
+import os
 
+import pytest
 from memory_tool import MemoryToolHandler
 
 
-class TestMemoryToolHandler(unittest.TestCase):
-    """Test suite for MemoryToolHandler."""
-
-    def setUp(self):
-        """Create temporary directory for each test."""
-        self.test_dir = tempfile.mkdtemp()
-        self.handler = MemoryToolHandler(base_path=self.test_dir)
-
-    def tearDown(self):
-        """Clean up temporary directory after each test."""
-        shutil.rmtree(self.test_dir)
-
-    # Security Tests
-
-    def test_path_validation_requires_memories_prefix(self):
-        """Test that paths must start with /memories."""
-        result = self.handler.execute(command="view", path="/etc/passwd")
-        self.assertIn("error", result)
-        self.assertIn("must start with /memories", result["error"])
-
-    def test_path_validation_prevents_traversal_dotdot(self):
-        """Test that .. traversal is blocked."""
-        result = self.handler.execute(
-            command="view", path="/memories/../../../etc/passwd"
-        )
-        self.assertIn("error", result)
-        self.assertIn("escape", result["error"].lower())
-
-    def test_path_validation_prevents_traversal_encoded(self):
-        """Test that URL-encoded traversal is blocked."""
-        result = self.handler.execute(
-            command="view", path="/memories/%2e%2e/%2e%2e/etc/passwd"
-        )
-        # The path will be processed and should fail validation
-        self.assertIn("error", result)
-
-    def test_path_validation_allows_valid_paths(self):
-        """Test that valid memory paths are accepted."""
-        result = self.handler.execute(
-            command="create", path="/memories/test.txt", file_text="test"
-        )
-        self.assertIn("success", result)
-
-    # View Command Tests
-
-    def test_view_empty_directory(self):
-        """Test viewing an empty /memories directory."""
-        result = self.handler.execute(command="view", path="/memories")
-        self.assertIn("success", result)
-        self.assertIn("empty", result["success"].lower())
-
-    def test_view_directory_with_files(self):
-        """Test viewing a directory with files."""
-        # Create some test files
-        self.handler.execute(
-            command="create", path="/memories/file1.txt", file_text="content1"
-        )
-        self.handler.execute(
-            command="create", path="/memories/file2.txt", file_text="content2"
-        )
-
-        result = self.handler.execute(command="view", path="/memories")
-        self.assertIn("success", result)
-        self.assertIn("file1.txt", result["success"])
-        self.assertIn("file2.txt", result["success"])
-
-    def test_view_file_with_line_numbers(self):
-        """Test viewing a file with line numbers."""
-        content = "line 1\nline 2\nline 3"
-        self.handler.execute(
-            command="create", path="/memories/test.txt", file_text=content
-        )
-
-        result = self.handler.execute(command="view", path="/memories/test.txt")
-        self.assertIn("success", result)
-        self.assertIn("   1: line 1", result["success"])
-        self.assertIn("   2: line 2", result["success"])
-        self.assertIn("   3: line 3", result["success"])
-
-    def test_view_file_with_range(self):
-        """Test viewing specific line range."""
-        content = "line 1\nline 2\nline 3\nline 4"
-        self.handler.execute(
-            command="create", path="/memories/test.txt", file_text=content
-        )
-
-        result = self.handler.execute(
-            command="view", path="/memories/test.txt", view_range=[2, 3]
-        )
-        self.assertIn("success", result)
-        self.assertIn("   2: line 2", result["success"])
-        self.assertIn("   3: line 3", result["success"])
-        self.assertNotIn("line 1", result["success"])
-        self.assertNotIn("line 4", result["success"])
-
-    def test_view_nonexistent_path(self):
-        """Test viewing a nonexistent path."""
-        result = self.handler.execute(command="view", path="/memories/notfound.txt")
-        self.assertIn("error", result)
-        self.assertIn("not found", result["error"].lower())
-
-    # Create Command Tests
-
-    def test_create_file(self):
-        """Test creating a file."""
-        result = self.handler.execute(
-            command="create", path="/memories/test.txt", file_text="Hello, World!"
-        )
-        self.assertIn("success", result)
-
-        # Verify file exists
-        file_path = Path(self.test_dir) / "memories" / "test.txt"
-        self.assertTrue(file_path.exists())
-        self.assertEqual(file_path.read_text(), "Hello, World!")
-
-    def test_create_file_in_subdirectory(self):
-        """Test creating a file in a subdirectory (auto-creates dirs)."""
-        result = self.handler.execute(
-            command="create",
-            path="/memories/subdir/test.txt",
-            file_text="Nested content",
-        )
-        self.assertIn("success", result)
-
-        file_path = Path(self.test_dir) / "memories" / "subdir" / "test.txt"
-        self.assertTrue(file_path.exists())
-
-    def test_create_requires_file_extension(self):
-        """Test that create only allows text file extensions."""
-        result = self.handler.execute(
-            command="create", path="/memories/noext", file_text="content"
-        )
-        self.assertIn("error", result)
-        self.assertIn("text files are supported", result["error"])
-
-    def test_create_overwrites_existing_file(self):
-        """Test that create overwrites existing files."""
-        self.handler.execute(
-            command="create", path="/memories/test.txt", file_text="original"
-        )
-        result = self.handler.execute(
-            command="create", path="/memories/test.txt", file_text="updated"
-        )
-        self.assertIn("success", result)
-
-        file_path = Path(self.test_dir) / "memories" / "test.txt"
-        self.assertEqual(file_path.read_text(), "updated")
-
-    # String Replace Command Tests
-
-    def test_str_replace_success(self):
-        """Test successful string replacement."""
-        self.handler.execute(
-            command="create",
-            path="/memories/test.txt",
-            file_text="Hello World",
-        )
-
-        result = self.handler.execute(
-            command="str_replace",
-            path="/memories/test.txt",
-            old_str="World",
-            new_str="Universe",
-        )
-        self.assertIn("success", result)
-
-        file_path = Path(self.test_dir) / "memories" / "test.txt"
-        self.assertEqual(file_path.read_text(), "Hello Universe")
-
-    def test_str_replace_string_not_found(self):
-        """Test replacement when string doesn't exist."""
-        self.handler.execute(
-            command="create", path="/memories/test.txt", file_text="Hello World"
-        )
-
-        result = self.handler.execute(
-            command="str_replace",
-            path="/memories/test.txt",
-            old_str="Missing",
-            new_str="Text",
-        )
-        self.assertIn("error", result)
-        self.assertIn("not found", result["error"].lower())
-
-    def test_str_replace_multiple_occurrences(self):
-        """Test that replacement fails with multiple occurrences."""
-        self.handler.execute(
-            command="create",
-            path="/memories/test.txt",
-            file_text="Hello World Hello World",
-        )
-
-        result = self.handler.execute(
-            command="str_replace",
-            path="/memories/test.txt",
-            old_str="Hello",
-            new_str="Hi",
-        )
-        self.assertIn("error", result)
-        self.assertIn("appears 2 times", result["error"])
-
-    def test_str_replace_file_not_found(self):
-        """Test replacement on nonexistent file."""
-        result = self.handler.execute(
-            command="str_replace",
-            path="/memories/notfound.txt",
-            old_str="old",
-            new_str="new",
-        )
-        self.assertIn("error", result)
-        self.assertIn("not found", result["error"].lower())
-
-    # Insert Command Tests
-
-    def test_insert_at_beginning(self):
-        """Test inserting at line 0 (beginning)."""
-        self.handler.execute(
-            command="create", path="/memories/test.txt", file_text="line 1\nline 2"
-        )
-
-        result = self.handler.execute(
-            command="insert",
-            path="/memories/test.txt",
-            insert_line=0,
-            insert_text="new line",
-        )
-        self.assertIn("success", result)
-
-        file_path = Path(self.test_dir) / "memories" / "test.txt"
-        self.assertEqual(file_path.read_text(), "new line\nline 1\nline 2\n")
-
-    def test_insert_in_middle(self):
-        """Test inserting in the middle."""
-        self.handler.execute(
-            command="create", path="/memories/test.txt", file_text="line 1\nline 2"
-        )
-
-        result = self.handler.execute(
-            command="insert",
-            path="/memories/test.txt",
-            insert_line=1,
-            insert_text="inserted",
-        )
-        self.assertIn("success", result)
-
-        file_path = Path(self.test_dir) / "memories" / "test.txt"
-        self.assertEqual(file_path.read_text(), "line 1\ninserted\nline 2\n")
-
-    def test_insert_at_end(self):
-        """Test inserting at the end."""
-        self.handler.execute(
-            command="create", path="/memories/test.txt", file_text="line 1\nline 2"
-        )
-
-        result = self.handler.execute(
-            command="insert",
-            path="/memories/test.txt",
-            insert_line=2,
-            insert_text="last line",
-        )
-        self.assertIn("success", result)
-
-    def test_insert_invalid_line(self):
-        """Test insert with invalid line number."""
-        self.handler.execute(
-            command="create", path="/memories/test.txt", file_text="line 1"
-        )
-
-        result = self.handler.execute(
-            command="insert",
-            path="/memories/test.txt",
-            insert_line=99,
-            insert_text="text",
-        )
-        self.assertIn("error", result)
-        self.assertIn("invalid", result["error"].lower())
-
-    # Delete Command Tests
-
-    def test_delete_file(self):
-        """Test deleting a file."""
-        self.handler.execute(
-            command="create", path="/memories/test.txt", file_text="content"
-        )
-
-        result = self.handler.execute(command="delete", path="/memories/test.txt")
-        self.assertIn("success", result)
-
-        file_path = Path(self.test_dir) / "memories" / "test.txt"
-        self.assertFalse(file_path.exists())
-
-    def test_delete_directory(self):
-        """Test deleting a directory."""
-        self.handler.execute(
-            command="create", path="/memories/subdir/test.txt", file_text="content"
-        )
-
-        result = self.handler.execute(command="delete", path="/memories/subdir")
-        self.assertIn("success", result)
-
-        dir_path = Path(self.test_dir) / "memories" / "subdir"
-        self.assertFalse(dir_path.exists())
-
-    def test_delete_cannot_delete_root(self):
-        """Test that root /memories directory cannot be deleted."""
-        result = self.handler.execute(command="delete", path="/memories")
-        self.assertIn("error", result)
-        self.assertIn("cannot delete", result["error"].lower())
-
-    def test_delete_nonexistent_path(self):
-        """Test deleting a nonexistent path."""
-        result = self.handler.execute(command="delete", path="/memories/notfound.txt")
-        self.assertIn("error", result)
-        self.assertIn("not found", result["error"].lower())
-
-    # Rename Command Tests
-
-    def test_rename_file(self):
-        """Test renaming a file."""
-        self.handler.execute(
-            command="create", path="/memories/old.txt", file_text="content"
-        )
-
-        result = self.handler.execute(
-            command="rename", old_path="/memories/old.txt", new_path="/memories/new.txt"
-        )
-        self.assertIn("success", result)
-
-        old_path = Path(self.test_dir) / "memories" / "old.txt"
-        new_path = Path(self.test_dir) / "memories" / "new.txt"
-        self.assertFalse(old_path.exists())
-        self.assertTrue(new_path.exists())
-
-    def test_rename_to_subdirectory(self):
-        """Test moving a file to a subdirectory."""
-        self.handler.execute(
-            command="create", path="/memories/file.txt", file_text="content"
-        )
-
-        result = self.handler.execute(
-            command="rename",
-            old_path="/memories/file.txt",
-            new_path="/memories/subdir/file.txt",
-        )
-        self.assertIn("success", result)
-
-        new_path = Path(self.test_dir) / "memories" / "subdir" / "file.txt"
-        self.assertTrue(new_path.exists())
-
-    def test_rename_source_not_found(self):
-        """Test rename when source doesn't exist."""
-        result = self.handler.execute(
-            command="rename",
-            old_path="/memories/notfound.txt",
-            new_path="/memories/new.txt",
-        )
-        self.assertIn("error", result)
-        self.assertIn("not found", result["error"].lower())
-
-    def test_rename_destination_exists(self):
-        """Test rename when destination already exists."""
-        self.handler.execute(
-            command="create", path="/memories/file1.txt", file_text="content1"
-        )
-        self.handler.execute(
-            command="create", path="/memories/file2.txt", file_text="content2"
-        )
-
-        result = self.handler.execute(
-            command="rename",
-            old_path="/memories/file1.txt",
-            new_path="/memories/file2.txt",
-        )
-        self.assertIn("error", result)
-        self.assertIn("already exists", result["error"].lower())
-
-    # Error Handling Tests
-
-    def test_unknown_command(self):
-        """Test handling of unknown command."""
-        result = self.handler.execute(command="invalid", path="/memories")
-        self.assertIn("error", result)
-        self.assertIn("unknown command", result["error"].lower())
-
-    def test_missing_required_parameters(self):
-        """Test error handling for missing parameters."""
-        result = self.handler.execute(command="view")
-        self.assertIn("error", result)
-
-    # Utility Tests
-
-    def test_clear_all_memory(self):
-        """Test clearing all memory."""
-        # Create some files
-        self.handler.execute(
-            command="create", path="/memories/file1.txt", file_text="content1"
-        )
-        self.handler.execute(
-            command="create", path="/memories/file2.txt", file_text="content2"
-        )
-
-        result = self.handler.clear_all_memory()
-        self.assertIn("success", result)
-
-        # Verify directory exists but is empty
-        memory_root = Path(self.test_dir) / "memories"
-        self.assertTrue(memory_root.exists())
-        self.assertEqual(len(list(memory_root.iterdir())), 0)
+@pytest.fixture
+def handler(tmp_path):
+    """Memory tool handler rooted in a per-test temporary directory."""
+    return MemoryToolHandler(base_path=str(tmp_path))
+
+
+@pytest.fixture(scope="module")
+def shared_handler(tmp_path_factory):
+    """Handler shared by tests that never modify /memories."""
+    return MemoryToolHandler(base_path=str(tmp_path_factory.mktemp("shared")))
+
+
+# Security Tests
+
+
+def test_path_validation_requires_memories_prefix(shared_handler):
+    """Test that paths must start with /memories."""
+    result = shared_handler.execute(command="view", path="/etc/passwd")
+    assert "error" in result
+    assert "must start with /memories" in result["error"]
+
+
+def test_path_validation_prevents_traversal_dotdot(shared_handler):
+    """Test that .. traversal is blocked."""
+    result = shared_handler.execute(
+        command="view", path="/memories/../../../etc/passwd"
+    )
+    assert "error" in result
+    assert "escape" in result["error"].lower()
+
+
+def test_path_validation_prevents_traversal_encoded(shared_handler):
+    """Test that URL-encoded traversal is blocked."""
+    result = shared_handler.execute(
+        command="view", path="/memories/%2e%2e/%2e%2e/etc/passwd"
+    )
+    # The path will be processed and should fail validation
+    assert "error" in result
+
+
+def test_path_validation_allows_valid_paths(handler):
+    """Test that valid memory paths are accepted."""
+    result = handler.execute(
+        command="create", path="/memories/test.txt", file_text="test"
+    )
+    assert "success" in result
+
+
+# View Command Tests
+
+
+def test_view_empty_directory(handler):
+    """Test viewing an empty /memories directory."""
+    result = handler.execute(command="view", path="/memories")
+    assert "success" in result
+    assert "empty" in result["success"].lower()
+
+
+def test_view_directory_with_files(handler):
+    """Test viewing a directory with files."""
+    # Create some test files
+    handler.execute(
+        command="create", path="/memories/file1.txt", file_text="content1"
+    )
+    handler.execute(
+        command="create", path="/memories/file2.txt", file_text="content2"
+    )
+
+    result = handler.execute(command="view", path="/memories")
+    assert "success" in result
+    assert "file1.txt" in result["success"]
+    assert "file2.txt" in result["success"]
+
+
+def test_view_directory_lists_subdirs_sorted_and_skips_hidden(handler, tmp_path):
+    """Test directory listing order, subdir suffix, and hidden file skip."""
+    handler.execute(command="create", path="/memories/zeta.txt", file_text="z")
+    handler.execute(
+        command="create", path="/memories/archive/old.txt", file_text="old"
+    )
+    handler.execute(command="create", path="/memories/notes.txt", file_text="n")
+    (tmp_path / "memories" / ".hidden.txt").write_text("secret")
+
+    result = handler.execute(command="view", path="/memories")
+    assert result["success"] == (
+        "Directory: /memories\n- archive/\n- notes.txt\n- zeta.txt"
+    )
+
+
+def test_view_file_with_line_numbers(handler):
+    """Test viewing a file with line numbers."""
+    content = "line 1\nline 2\nline 3"
+    handler.execute(
+        command="create", path="/memories/test.txt", file_text=content
+    )
+
+    result = handler.execute(command="view", path="/memories/test.txt")
+    assert "success" in result
+    assert "   1: line 1" in result["success"]
+    assert "   2: line 2" in result["success"]
+    assert "   3: line 3" in result["success"]
+
+
+def test_view_file_with_range(handler):
+    """Test viewing specific line range."""
+    content = "line 1\nline 2\nline 3\nline 4"
+    handler.execute(
+        command="create", path="/memories/test.txt", file_text=content
+    )
+
+    result = handler.execute(
+        command="view", path="/memories/test.txt", view_range=[2, 3]
+    )
+    assert "success" in result
+    assert "   2: line 2" in result["success"]
+    assert "   3: line 3" in result["success"]
+    assert "line 1" not in result["success"]
+    assert "line 4" not in result["success"]
+
+
+# Create Command Tests
+
+
+def test_create_file(handler, tmp_path):
+    """Test creating a file."""
+    result = handler.execute(
+        command="create", path="/memories/test.txt", file_text="Hello, World!"
+    )
+    assert "success" in result
+
+    # Verify file exists
+    file_path = tmp_path / "memories" / "test.txt"
+    assert file_path.exists()
+    assert file_path.read_text() == "Hello, World!"
+
+
+def test_create_file_in_subdirectory(handler, tmp_path):
+    """Test creating a file in a subdirectory (auto-creates dirs)."""
+    result = handler.execute(
+        command="create",
+        path="/memories/subdir/test.txt",
+        file_text="Nested content",
+    )
+    assert "success" in result
+
+    file_path = tmp_path / "memories" / "subdir" / "test.txt"
+    assert file_path.exists()
+
+
+def test_create_requires_file_extension(shared_handler):
+    """Test that create only allows text file extensions."""
+    result = shared_handler.execute(
+        command="create", path="/memories/noext", file_text="content"
+    )
+    assert "error" in result
+    assert "text files are supported" in result["error"]
+
+
+def test_create_overwrites_existing_file(handler, tmp_path):
+    """Test that create overwrites existing files."""
+    handler.execute(
+        command="create", path="/memories/test.txt", file_text="original"
+    )
+    result = handler.execute(
+        command="create", path="/memories/test.txt", file_text="updated"
+    )
+    assert "success" in result
+
+    file_path = tmp_path / "memories" / "test.txt"
+    assert file_path.read_text() == "updated"
+
+
+# String Replace Command Tests
+
+
+def test_str_replace_success(handler, tmp_path):
+    """Test successful string replacement."""
+    handler.execute(
+        command="create",
+        path="/memories/test.txt",
+        file_text="Hello World",
+    )
+
+    result = handler.execute(
+        command="str_replace",
+        path="/memories/test.txt",
+        old_str="World",
+        new_str="Universe",
+    )
+    assert "success" in result
+
+    file_path = tmp_path / "memories" / "test.txt"
+    assert file_path.read_text() == "Hello Universe"
+
+
+def test_str_replace_string_not_found(handler):
+    """Test replacement when string doesn't exist."""
+    handler.execute(
+        command="create", path="/memories/test.txt", file_text="Hello World"
+    )
+
+    result = handler.execute(
+        command="str_replace",
+        path="/memories/test.txt",
+        old_str="Missing",
+        new_str="Text",
+    )
+    assert "error" in result
+    assert "not found" in result["error"].lower()
+
+
+def test_str_replace_multiple_occurrences(handler):
+    """Test that replacement fails with multiple occurrences."""
+    handler.execute(
+        command="create",
+        path="/memories/test.txt",
+        file_text="Hello World Hello World",
+    )
+
+    result = handler.execute(
+        command="str_replace",
+        path="/memories/test.txt",
+        old_str="Hello",
+        new_str="Hi",
+    )
+    assert "error" in result
+    assert "appears 2 times" in result["error"]
+
+
+# Insert Command Tests
+
+
+@pytest.fixture
+def two_line_file(handler, tmp_path):
+    """Create /memories/test.txt with two lines and return its real path."""
+    handler.execute(
+        command="create", path="/memories/test.txt", file_text="line 1\nline 2"
+    )
+    return tmp_path / "memories" / "test.txt"
+
+
+@pytest.mark.parametrize(
+    ("insert_line", "insert_text", "expected"),
+    [
+        (0, "new line", "new line\nline 1\nline 2\n"),
+        (1, "inserted", "line 1\ninserted\nline 2\n"),
+        (2, "last line", "line 1\nline 2\nlast line\n"),
+    ],
+    ids=["beginning", "middle", "end"],
+)
+def test_insert(handler, two_line_file, insert_line, insert_text, expected):
+    """Test inserting at the beginning, middle, and end of a file."""
+    result = handler.execute(
+        command="insert",
+        path="/memories/test.txt",
+        insert_line=insert_line,
+        insert_text=insert_text,
+    )
+    assert "success" in result
+    assert two_line_file.read_text() == expected
+
+
+def test_insert_invalid_line(handler):
+    """Test insert with invalid line number."""
+    handler.execute(
+        command="create", path="/memories/test.txt", file_text="line 1"
+    )
+
+    result = handler.execute(
+        command="insert",
+        path="/memories/test.txt",
+        insert_line=99,
+        insert_text="text",
+    )
+    assert "error" in result
+    assert "invalid" in result["error"].lower()
+
+
+# Delete Command Tests
+
+
+def test_delete_file(handler, tmp_path):
+    """Test deleting a file."""
+    handler.execute(
+        command="create", path="/memories/test.txt", file_text="content"
+    )
+
+    result = handler.execute(command="delete", path="/memories/test.txt")
+    assert "success" in result
+
+    file_path = tmp_path / "memories" / "test.txt"
+    assert not file_path.exists()
+
+
+def test_delete_directory(handler, tmp_path):
+    """Test deleting a directory."""
+    handler.execute(
+        command="create", path="/memories/subdir/test.txt", file_text="content"
+    )
+
+    result = handler.execute(command="delete", path="/memories/subdir")
+    assert "success" in result
+
+    dir_path = tmp_path / "memories" / "subdir"
+    assert not dir_path.exists()
+
+
+def test_delete_cannot_delete_root(shared_handler):
+    """Test that root /memories directory cannot be deleted."""
+    result = shared_handler.execute(command="delete", path="/memories")
+    assert "error" in result
+    assert "cannot delete" in result["error"].lower()
+
+
+# Rename Command Tests
+
+
+def test_rename_file(handler, tmp_path):
+    """Test renaming a file."""
+    handler.execute(
+        command="create", path="/memories/old.txt", file_text="content"
+    )
+
+    result = handler.execute(
+        command="rename", old_path="/memories/old.txt", new_path="/memories/new.txt"
+    )
+    assert "success" in result
+
+    old_path = tmp_path / "memories" / "old.txt"
+    new_path = tmp_path / "memories" / "new.txt"
+    assert not old_path.exists()
+    assert new_path.exists()
+
+
+def test_rename_to_subdirectory(handler, tmp_path):
+    """Test moving a file to a subdirectory."""
+    handler.execute(
+        command="create", path="/memories/file.txt", file_text="content"
+    )
+
+    result = handler.execute(
+        command="rename",
+        old_path="/memories/file.txt",
+        new_path="/memories/subdir/file.txt",
+    )
+    assert "success" in result
+
+    new_path = tmp_path / "memories" / "subdir" / "file.txt"
+    assert new_path.exists()
+
+
+def test_rename_destination_exists(handler):
+    """Test rename when destination already exists."""
+    handler.execute(
+        command="create", path="/memories/file1.txt", file_text="content1"
+    )
+    handler.execute(
+        command="create", path="/memories/file2.txt", file_text="content2"
+    )
+
+    result = handler.execute(
+        command="rename",
+        old_path="/memories/file1.txt",
+        new_path="/memories/file2.txt",
+    )
+    assert "error" in result
+    assert "already exists" in result["error"].lower()
+
+
+# Error Handling Tests
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"command": "view", "path": "/memories/notfound.txt"},
+        {
+            "command": "str_replace",
+            "path": "/memories/notfound.txt",
+            "old_str": "old",
+            "new_str": "new",
+        },
+        {"command": "delete", "path": "/memories/notfound.txt"},
+        {
+            "command": "rename",
+            "old_path": "/memories/notfound.txt",
+            "new_path": "/memories/new.txt",
+        },
+    ],
+    ids=lambda params: params["command"],
+)
+def test_nonexistent_path(shared_handler, params):
+    """Test that each command reports a missing path."""
+    result = shared_handler.execute(**params)
+    assert "error" in result
+    assert "not found" in result["error"].lower()
+
+
+def test_unknown_command(shared_handler):
+    """Test handling of unknown command."""
+    result = shared_handler.execute(command="invalid", path="/memories")
+    assert "error" in result
+    assert "unknown command" in result["error"].lower()
+
+
+def test_missing_required_parameters(shared_handler):
+    """Test error handling for missing parameters."""
+    result = shared_handler.execute(command="view")
+    assert "error" in result
+
+
+# Utility Tests
+
+
+def test_clear_all_memory(handler, tmp_path):
+    """Test clearing all memory."""
+    # Create some files
+    handler.execute(
+        command="create", path="/memories/file1.txt", file_text="content1"
+    )
+    handler.execute(
+        command="create", path="/memories/file2.txt", file_text="content2"
+    )
+
+    result = handler.clear_all_memory()
+    assert "success" in result
+
+    # Verify directory exists but is empty
+    memory_root = tmp_path / "memories"
+    assert memory_root.exists()
+    with os.scandir(memory_root) as entries:
+        assert sum(1 for _ in entries) == 0
 
 
 if __name__ == "__main__":
-    unittest.main()
+    raise SystemExit(pytest.main([__file__]))